@@ -18,12 +18,43 @@ Test script for the AggregationService API
 This demonstrates how to use the new DMTF Redfish standard AggregationService
 """
 
+import hashlib
+import http.client
 import json
+import os
 import sys
-import urllib.request
+import tempfile
+import threading
 import urllib.parse
-import urllib.error
-from typing import Optional, Dict, Any
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Tuple
+
+# Use orjson for (de)serialization when available -- it is several times
+# faster than stdlib json on the large Redfish collection payloads this
+# script pretty-prints -- but keep stdlib json as the no-dependency fallback.
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def _loads(text: str) -> Any:
+        return orjson.loads(text)
+
+    def _pretty(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+
+except ImportError:
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+    def _loads(text: str) -> Any:
+        return json.loads(text)
+
+    def _pretty(obj: Any) -> str:
+        return json.dumps(obj, indent=2)
 
 
 class AggregationServiceTester:
@@ -31,113 +62,226 @@ class AggregationServiceTester:
         self.base_url = base_url.rstrip("/")
         self.auth_token: Optional[str] = None
 
+        # Baseline headers sent with every request. authenticate() replaces
+        # this with a dict carrying X-Auth-Token once, instead of branching
+        # on the token for every call.
+        self._default_headers: Dict[str, str] = {'Connection': 'keep-alive'}
+
+        # Keep TCP connections open for the whole test run so requests
+        # reuse them (HTTP keep-alive) instead of paying a fresh handshake
+        # per call. Connections are per-thread because http.client
+        # connections are not thread-safe and independent GETs run
+        # concurrently.
+        parts = urllib.parse.urlsplit(self.base_url)
+        self._scheme = parts.scheme or 'http'
+        self._host = parts.hostname or 'localhost'
+        self._port = parts.port
+        self._local = threading.local()
+        self._conns: List[http.client.HTTPConnection] = []
+        self._conns_lock = threading.Lock()
+
+    def _open_connection(self) -> http.client.HTTPConnection:
+        if self._scheme == 'https':
+            conn = http.client.HTTPSConnection(self._host, self._port, timeout=10)
+        else:
+            conn = http.client.HTTPConnection(self._host, self._port, timeout=10)
+        with self._conns_lock:
+            self._conns.append(conn)
+        return conn
+
+    def _get_conn(self) -> http.client.HTTPConnection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._open_connection()
+            self._local.conn = conn
+        return conn
+
+    def close(self):
+        """Close all underlying HTTP connections."""
+        with self._conns_lock:
+            for conn in self._conns:
+                conn.close()
+            self._conns.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _token_cache_path(self, username: str) -> Path:
+        digest = hashlib.sha256(f"{self.base_url}|{username}".encode()).hexdigest()[:12]
+        return Path(tempfile.gettempdir()) / f"shoal-sess-{digest}.json"
+
+    def _try_cached_token(self, username: str) -> bool:
+        """Reuse a session token cached by a previous run if the service
+        still accepts it, skipping the session-creation POST entirely."""
+        cache_path = self._token_cache_path(username)
+        try:
+            cached = _loads(cache_path.read_text())
+        except (OSError, ValueError):
+            return False
+
+        token = cached.get('token')
+        if not token:
+            return False
+
+        # Probe a cheap authenticated endpoint with the cached token; any
+        # error (401, connection refused, ...) falls back to a fresh login.
+        old_headers = self._default_headers
+        self._default_headers = old_headers | {'X-Auth-Token': token}
+        response = self.make_request("/redfish/v1/SessionService/Sessions")
+        if not response or "error" in response:
+            self._default_headers = old_headers
+            try:
+                cache_path.unlink()
+            except OSError:
+                pass
+            return False
+
+        self.auth_token = token
+        return True
+
+    def _store_cached_token(self, username: str) -> None:
+        cache_path = self._token_cache_path(username)
+        tmp_path = cache_path.with_suffix('.tmp')
+        try:
+            # 0600 and an atomic replace: the token grants API access.
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(_dumps({'token': self.auth_token}))
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass
+
     def authenticate(self, username: str = "admin", password: str = "admin") -> bool:
         """Authenticate with the Redfish service."""
         print("1. Authenticating...")
 
-        url = f"{self.base_url}/redfish/v1/SessionService/Sessions"
-        data = json.dumps({
+        if self._try_cached_token(username):
+            print("   ✓ Reused cached session token")
+            return True
+
+        data = {
             "UserName": username,
             "Password": password
-        }).encode('utf-8')
+        }
 
-        try:
-            req = urllib.request.Request(url, data=data, method='POST')
-            req.add_header('Content-Type', 'application/json')
-
-            with urllib.request.urlopen(req) as response:
-                # Try to get token from header first
-                self.auth_token = response.headers.get('X-Auth-Token')
-                if not self.auth_token:
-                    # Try to parse from response body
-                    response_data = json.loads(response.read().decode('utf-8'))
-                    self.auth_token = response_data.get('X-Auth-Token')
-
-                if self.auth_token:
-                    print("   ✓ Authenticated successfully")
-                    return True
-                else:
-                    print("   ✗ Failed to get auth token")
-                    return False
-
-        except urllib.error.HTTPError as e:
-            print(f"   ✗ Authentication failed: {e.code} {e.reason}")
-            if e.code == 401:
+        response = self.make_request("/redfish/v1/SessionService/Sessions", method='POST', data=data)
+        if response is None:
+            print("   ✗ Failed to authenticate")
+            return False
+
+        if "error" in response:
+            status = response.get("status")
+            print(f"   ✗ Authentication failed: {response['error']}")
+            if status == 401:
                 print("   Make sure admin/admin credentials are valid")
+            elif status is None:
+                print("   Make sure the service is running at", self.base_url)
             return False
-        except Exception as e:
-            print(f"   ✗ Failed to authenticate: {e}")
-            print("   Make sure the service is running at", self.base_url)
+
+        # Try to get token from header first, then from the response body
+        self.auth_token = response.get('_headers', {}).get('X-Auth-Token')
+        if not self.auth_token:
+            self.auth_token = response.get('X-Auth-Token')
+
+        if self.auth_token:
+            self._default_headers = self._default_headers | {'X-Auth-Token': self.auth_token}
+            self._store_cached_token(username)
+            print("   ✓ Authenticated successfully")
+            return True
+        else:
+            print("   ✗ Failed to get auth token")
             return False
 
     def make_request(self, path: str, method: str = 'GET', data: Optional[Dict] = None) -> Optional[Dict[str, Any]]:
-        """Make an authenticated request to the API."""
-        url = f"{self.base_url}{path}"
-
+        """Make an authenticated request to the API over the shared connection."""
         request_data = None
-        if data:
-            request_data = json.dumps(data).encode('utf-8')
+        headers = self._default_headers
+        if data is not None:
+            request_data = _dumps(data)
+            headers = headers | {'Content-Type': 'application/json'}
 
         try:
-            req = urllib.request.Request(url, data=request_data, method=method)
-            if self.auth_token:
-                req.add_header('X-Auth-Token', self.auth_token)
-            if request_data:
-                req.add_header('Content-Type', 'application/json')
-
-            with urllib.request.urlopen(req) as response:
-                if method == 'DELETE' and response.status == 204:
-                    return {}  # No content expected
-                response_text = response.read().decode('utf-8')
-                if response_text:
-                    return json.loads(response_text)
-                return {}
-
-        except urllib.error.HTTPError as e:
-            error_body = e.read().decode('utf-8')
+            conn = self._get_conn()
             try:
-                error_json = json.loads(error_body)
-                return {"error": error_json, "status": e.code}
-            except:
-                return {"error": error_body, "status": e.code}
+                conn.request(method, path, body=request_data, headers=headers)
+                response = conn.getresponse()
+            except (http.client.HTTPException, ConnectionError, OSError):
+                # The server may have dropped an idle keep-alive socket;
+                # reconnect once and retry before giving up.
+                conn.close()
+                conn = self._open_connection()
+                self._local.conn = conn
+                conn.request(method, path, body=request_data, headers=headers)
+                response = conn.getresponse()
+
+            response_body = response.read().decode('utf-8')
+
+            if response.status >= 400:
+                try:
+                    return {"error": _loads(response_body), "status": response.status}
+                except ValueError:
+                    return {"error": response_body, "status": response.status}
+
+            if method == 'DELETE' and response.status == 204:
+                return {}  # No content expected
+
+            result: Dict[str, Any] = {}
+            if response_body:
+                result = _loads(response_body)
+
+            # Surface interesting response headers (e.g. X-Auth-Token from
+            # session creation) without shadowing body fields.
+            token = response.getheader('X-Auth-Token')
+            if token:
+                result.setdefault('_headers', {})['X-Auth-Token'] = token
+
+            return result
+
         except Exception as e:
             return {"error": str(e)}
 
-    def check_service_root(self) -> bool:
-        """Check if AggregationService is available in the service root."""
-        print("\n2. Checking Service Root...")
+    def check_service_root(self) -> Tuple[List[str], bool]:
+        """Check if AggregationService is available in the service root.
+
+        Returns the output lines alongside the result so concurrent checks
+        can be printed deterministically by the caller.
+        """
+        lines = ["\n2. Checking Service Root..."]
 
         response = self.make_request("/redfish/v1/")
         if response and "AggregationService" in response:
-            print("   ✓ AggregationService is available in Service Root")
-            return True
+            lines.append("   ✓ AggregationService is available in Service Root")
+            return lines, True
         else:
-            print("   ✗ AggregationService not found in Service Root")
-            return False
+            lines.append("   ✗ AggregationService not found in Service Root")
+            return lines, False
 
-    def get_aggregation_service(self) -> Optional[Dict]:
+    def get_aggregation_service(self) -> Tuple[List[str], Optional[Dict]]:
         """Get the AggregationService resource."""
-        print("\n3. Getting AggregationService...")
+        lines = ["\n3. Getting AggregationService..."]
 
         response = self.make_request("/redfish/v1/AggregationService")
         if response and "error" not in response:
-            print("   Response:", json.dumps(response, indent=2))
-            return response
+            lines.append("   Response: " + _pretty(response))
+            return lines, response
         else:
-            print("   ✗ Failed to get AggregationService:", response)
-            return None
+            lines.append(f"   ✗ Failed to get AggregationService: {response}")
+            return lines, None
 
-    def list_connection_methods(self) -> Optional[Dict]:
+    def list_connection_methods(self) -> Tuple[List[str], Optional[Dict]]:
         """List current ConnectionMethods."""
-        print("\n4. Listing current ConnectionMethods...")
+        lines = ["\n4. Listing current ConnectionMethods..."]
 
         response = self.make_request("/redfish/v1/AggregationService/ConnectionMethods")
         if response and "error" not in response:
-            print("   Response:", json.dumps(response, indent=2))
-            return response
+            lines.append("   Response: " + _pretty(response))
+            return lines, response
         else:
-            print("   ✗ Failed to list ConnectionMethods:", response)
-            return None
+            lines.append(f"   ✗ Failed to list ConnectionMethods: {response}")
+            return lines, None
 
     def add_connection_method(self, name: str, address: str, username: str, password: str) -> Optional[Dict]:
         """Add a new ConnectionMethod."""
@@ -164,37 +308,37 @@ class AggregationServiceTester:
 
         if response and "error" not in response:
             print("   ✓ ConnectionMethod added successfully")
-            print("   Response:", json.dumps(response, indent=2))
+            print("   Response:", _pretty(response))
             return response
         else:
             print("   ✗ Failed to add ConnectionMethod:", response)
             return None
 
-    def check_managers_collection(self) -> Optional[Dict]:
+    def check_managers_collection(self) -> Tuple[List[str], Optional[Dict]]:
         """Check the aggregated Managers collection."""
-        print("\n6. Checking aggregated Managers collection...")
+        lines = ["\n6. Checking aggregated Managers collection..."]
 
         response = self.make_request("/redfish/v1/Managers")
         if response and "error" not in response:
-            print(f"   Found {response.get('Members@odata.count', 0)} managers")
-            print("   Response:", json.dumps(response, indent=2))
-            return response
+            lines.append(f"   Found {response.get('Members@odata.count', 0)} managers")
+            lines.append("   Response: " + _pretty(response))
+            return lines, response
         else:
-            print("   ✗ Failed to get Managers collection:", response)
-            return None
+            lines.append(f"   ✗ Failed to get Managers collection: {response}")
+            return lines, None
 
-    def check_systems_collection(self) -> Optional[Dict]:
+    def check_systems_collection(self) -> Tuple[List[str], Optional[Dict]]:
         """Check the aggregated Systems collection."""
-        print("\n7. Checking aggregated Systems collection...")
+        lines = ["\n7. Checking aggregated Systems collection..."]
 
         response = self.make_request("/redfish/v1/Systems")
         if response and "error" not in response:
-            print(f"   Found {response.get('Members@odata.count', 0)} systems")
-            print("   Response:", json.dumps(response, indent=2))
-            return response
+            lines.append(f"   Found {response.get('Members@odata.count', 0)} systems")
+            lines.append("   Response: " + _pretty(response))
+            return lines, response
         else:
-            print("   ✗ Failed to get Systems collection:", response)
-            return None
+            lines.append(f"   ✗ Failed to get Systems collection: {response}")
+            return lines, None
 
     def delete_connection_method(self, method_id: str) -> bool:
         """Delete a ConnectionMethod by ID."""
@@ -238,32 +382,44 @@ def main():
 
     args = parser.parse_args()
 
-    # Create tester instance
-    tester = AggregationServiceTester(args.url)
-
-    # Run tests
-    if not tester.authenticate(args.username, args.password):
-        print("\n✗ Authentication failed. Cannot continue.")
-        return 1
-
-    tester.check_service_root()
-    tester.get_aggregation_service()
-    tester.list_connection_methods()
-
-    if not args.skip_add:
-        method = tester.add_connection_method(
-            "Test BMC",
-            args.bmc_address,
-            args.bmc_username,
-            args.bmc_password
-        )
-
-        # If we successfully added a method, try to delete it to clean up
-        if method and "Id" in method:
-            tester.delete_connection_method(method["Id"])
-
-    tester.check_managers_collection()
-    tester.check_systems_collection()
+    # Create tester instance; the context manager closes the shared
+    # keep-alive connection when the run finishes.
+    with AggregationServiceTester(args.url) as tester:
+        # Run tests
+        if not tester.authenticate(args.username, args.password):
+            print("\n✗ Authentication failed. Cannot continue.")
+            return 1
+
+        # The read-only checks are independent of each other, so issue them
+        # concurrently and print the collected output in step order; only
+        # add/delete have an ordering dependency and stay serial.
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [
+                pool.submit(tester.check_service_root),
+                pool.submit(tester.get_aggregation_service),
+                pool.submit(tester.list_connection_methods),
+                pool.submit(tester.check_managers_collection),
+                pool.submit(tester.check_systems_collection),
+            ]
+            results = [f.result() for f in futures]
+
+        for lines, _ in results[:3]:
+            print("\n".join(lines))
+
+        if not args.skip_add:
+            method = tester.add_connection_method(
+                "Test BMC",
+                args.bmc_address,
+                args.bmc_username,
+                args.bmc_password
+            )
+
+            # If we successfully added a method, try to delete it to clean up
+            if method and "Id" in method:
+                tester.delete_connection_method(method["Id"])
+
+        for lines, _ in results[3:]:
+            print("\n".join(lines))
 
     print("\n========================================")
     print("Test completed!")